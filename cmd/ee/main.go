@@ -21,6 +21,32 @@ var (
 )
 
 func main() {
+	// Long-running mode used by the integration tests: ee --serve <socket>.
+	// Only available in binaries built with -tags eeserve.
+	if len(os.Args) == 3 && os.Args[1] == "--serve" {
+		if err := serve(os.Args[2], runCommand); err != nil {
+			fmt.Fprintln(os.Stderr, err)
+			os.Exit(1)
+		}
+		return
+	}
+
+	if err := newRootCommand().Execute(); err != nil {
+		fmt.Fprintln(os.Stderr, err)
+		os.Exit(1)
+	}
+}
+
+// runCommand executes a single ee invocation with the given arguments on a
+// freshly built command tree, so no flag state leaks between invocations.
+func runCommand(args []string) error {
+	rootCmd := newRootCommand()
+	rootCmd.SetArgs(args)
+	return rootCmd.Execute()
+}
+
+// newRootCommand builds the complete ee command tree
+func newRootCommand() *cobra.Command {
 	// Create root command using the dedicated root command module
 	rootCmd := command.NewRootCommand()
 	rootCmd.Version = version
@@ -41,10 +67,14 @@ func main() {
 			cfg.ConfigFile = cfgFile
 		}
 
-		// Initialize command context (includes project detection)
-		commandContext, err := util.NewCommandContext(cfg)
-		if err != nil {
-			return fmt.Errorf("failed to initialize command context: %w", err)
+		// Initialize command context (includes project detection unless the
+		// command never reads the project)
+		commandContext := &util.CommandContext{Config: cfg}
+		if cmd.Annotations[command.SkipProjectDetection] != "true" {
+			commandContext, err = util.NewCommandContext(cfg)
+			if err != nil {
+				return fmt.Errorf("failed to initialize command context: %w", err)
+			}
 		}
 
 		ctx := command.WithCommandContext(cmd.Context(), commandContext)
@@ -84,9 +114,5 @@ func main() {
 	// Enable version flag
 	rootCmd.SetVersionTemplate("{{.Version}}\n")
 
-	// Execute
-	if err := rootCmd.Execute(); err != nil {
-		fmt.Fprintln(os.Stderr, err)
-		os.Exit(1)
-	}
+	return rootCmd
 }
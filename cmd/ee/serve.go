@@ -0,0 +1,289 @@
+//go:build unix && eeserve
+
+package main
+
+import (
+	"bytes"
+	"encoding/binary"
+	"encoding/json"
+	"fmt"
+	"io"
+	"net"
+	"os"
+	"syscall"
+
+	"golang.org/x/sys/unix"
+)
+
+// maxFrameSize bounds a single request or response frame
+const maxFrameSize = 64 << 20
+
+// serveRequest is a single ee invocation received over the serve socket
+type serveRequest struct {
+	Argv  []string          `json:"argv"`
+	Cwd   string            `json:"cwd,omitempty"`
+	Stdin string            `json:"stdin,omitempty"`
+	Env   map[string]string `json:"env,omitempty"`
+}
+
+// serveResponse carries the captured output and exit code of an invocation
+type serveResponse struct {
+	Stdout string `json:"stdout"`
+	Stderr string `json:"stderr"`
+	RC     int    `json:"rc"`
+}
+
+// serve keeps ee running and executes invocations received on a Unix socket,
+// so callers that run many short commands (the integration tests) pay process
+// startup once. It is only compiled in with the eeserve build tag, which
+// `make test-daemon` sets; release builds do not contain it. Each connection carries one length-prefixed JSON request and
+// receives one length-prefixed JSON response. Requests are handled strictly
+// one at a time because every invocation temporarily takes over the
+// process-wide working directory, environment, arguments and standard streams.
+func serve(sockPath string, run func(args []string) error) error {
+	listener, err := listenUnix(sockPath)
+	if err != nil {
+		return err
+	}
+	defer func() {
+		_ = listener.Close()
+	}()
+
+	for {
+		conn, err := listener.Accept()
+		if err != nil {
+			return fmt.Errorf("failed to accept connection: %w", err)
+		}
+		handleServeConn(conn, run)
+	}
+}
+
+// listenUnix listens on sockPath, first removing a stale socket left behind by
+// an earlier server. Any other existing file is left alone and makes listening fail.
+func listenUnix(sockPath string) (net.Listener, error) {
+	if info, err := os.Lstat(sockPath); err == nil && info.Mode()&os.ModeSocket != 0 {
+		_ = os.Remove(sockPath)
+	}
+
+	listener, err := net.Listen("unix", sockPath)
+	if err != nil {
+		return nil, fmt.Errorf("failed to listen on %s: %w", sockPath, err)
+	}
+	return listener, nil
+}
+
+// handleServeConn reads one request from conn, executes it and writes the response
+func handleServeConn(conn net.Conn, run func(args []string) error) {
+	defer func() {
+		_ = conn.Close()
+	}()
+
+	var req serveRequest
+	if err := readFrame(conn, &req); err != nil {
+		return
+	}
+
+	resp, err := executeRequest(req, run)
+	if err != nil {
+		resp = serveResponse{Stderr: err.Error() + "\n", RC: 1}
+	}
+	_ = writeFrame(conn, resp)
+}
+
+// executeRequest runs a single invocation inside the request's working
+// directory, environment and arguments, capturing stdout and stderr
+func executeRequest(req serveRequest, run func(args []string) error) (serveResponse, error) {
+	restoreState, err := enterRequestState(req)
+	if err != nil {
+		return serveResponse{}, err
+	}
+	defer restoreState()
+
+	restoreStdin, err := replaceStdin(req.Stdin)
+	if err != nil {
+		return serveResponse{}, err
+	}
+	defer restoreStdin()
+
+	finishStdout, err := captureFd(unix.Stdout)
+	if err != nil {
+		return serveResponse{}, err
+	}
+	finishStderr, err := captureFd(unix.Stderr)
+	if err != nil {
+		finishStdout()
+		return serveResponse{}, err
+	}
+
+	rc := runCaptured(run, req.Argv)
+
+	return serveResponse{
+		Stdout: finishStdout(),
+		Stderr: finishStderr(),
+		RC:     rc,
+	}, nil
+}
+
+// runCaptured runs the command the same way main does and returns its exit code
+func runCaptured(run func(args []string) error, args []string) (rc int) {
+	defer func() {
+		if r := recover(); r != nil {
+			fmt.Fprintf(os.Stderr, "panic: %v\n", r)
+			rc = 2
+		}
+	}()
+
+	if err := run(args); err != nil {
+		fmt.Fprintln(os.Stderr, err)
+		return 1
+	}
+	return 0
+}
+
+// enterRequestState switches the working directory, environment and os.Args
+// to those of the request and returns a function that restores them
+func enterRequestState(req serveRequest) (func(), error) {
+	previousDir, err := os.Getwd()
+	if err != nil {
+		return nil, fmt.Errorf("failed to get current directory: %w", err)
+	}
+	if req.Cwd != "" {
+		if err := os.Chdir(req.Cwd); err != nil {
+			return nil, fmt.Errorf("failed to change directory to %s: %w", req.Cwd, err)
+		}
+	}
+
+	previousEnv := make(map[string]*string, len(req.Env))
+	for key, value := range req.Env {
+		if old, ok := os.LookupEnv(key); ok {
+			previousEnv[key] = &old
+		} else {
+			previousEnv[key] = nil
+		}
+		_ = os.Setenv(key, value)
+	}
+
+	previousArgs := os.Args
+	os.Args = append([]string{previousArgs[0]}, req.Argv...)
+
+	return func() {
+		os.Args = previousArgs
+		for key, old := range previousEnv {
+			if old == nil {
+				_ = os.Unsetenv(key)
+			} else {
+				_ = os.Setenv(key, *old)
+			}
+		}
+		_ = os.Chdir(previousDir)
+	}, nil
+}
+
+// replaceStdin points file descriptor 0 at a pipe holding input and returns a
+// function that restores the original stdin
+func replaceStdin(input string) (func(), error) {
+	r, w, err := os.Pipe()
+	if err != nil {
+		return nil, fmt.Errorf("failed to create stdin pipe: %w", err)
+	}
+	go func() {
+		_, _ = io.WriteString(w, input)
+		_ = w.Close()
+	}()
+
+	// Fd switches the read end to blocking mode, which os.Stdin expects
+	restore, err := redirectFd(int(r.Fd()), unix.Stdin)
+	_ = r.Close()
+	if err != nil {
+		return nil, err
+	}
+	return restore, nil
+}
+
+// captureFd points fd at a pipe and returns a function that restores fd and
+// returns everything written to it in the meantime
+func captureFd(fd int) (func() string, error) {
+	r, w, err := os.Pipe()
+	if err != nil {
+		return nil, fmt.Errorf("failed to create capture pipe: %w", err)
+	}
+
+	var buf bytes.Buffer
+	done := make(chan struct{})
+	go func() {
+		_, _ = io.Copy(&buf, r)
+		close(done)
+	}()
+
+	// Fd switches the write end to blocking mode so large outputs never see EAGAIN
+	restore, err := redirectFd(int(w.Fd()), fd)
+	_ = w.Close()
+	if err != nil {
+		<-done
+		_ = r.Close()
+		return nil, err
+	}
+
+	return func() string {
+		restore()
+		<-done
+		_ = r.Close()
+		return buf.String()
+	}, nil
+}
+
+// redirectFd makes fd refer to the same file as source and returns a function
+// that restores the original target of fd
+func redirectFd(source, fd int) (func(), error) {
+	// The saved copy must not leak into commands run by the invocation, so it
+	// is marked close-on-exec under ForkLock like the descriptors os opens
+	syscall.ForkLock.RLock()
+	saved, err := unix.Dup(fd)
+	if err == nil {
+		unix.CloseOnExec(saved)
+	}
+	syscall.ForkLock.RUnlock()
+	if err != nil {
+		return nil, fmt.Errorf("failed to duplicate fd %d: %w", fd, err)
+	}
+	if err := unix.Dup2(source, fd); err != nil {
+		_ = unix.Close(saved)
+		return nil, fmt.Errorf("failed to redirect fd %d: %w", fd, err)
+	}
+
+	return func() {
+		_ = unix.Dup2(saved, fd)
+		_ = unix.Close(saved)
+	}, nil
+}
+
+// readFrame reads a big-endian uint32 length followed by a JSON document
+func readFrame(r io.Reader, v interface{}) error {
+	var size uint32
+	if err := binary.Read(r, binary.BigEndian, &size); err != nil {
+		return fmt.Errorf("failed to read frame header: %w", err)
+	}
+	if size > maxFrameSize {
+		return fmt.Errorf("frame of %d bytes exceeds limit", size)
+	}
+
+	data := make([]byte, size)
+	if _, err := io.ReadFull(r, data); err != nil {
+		return fmt.Errorf("failed to read frame body: %w", err)
+	}
+	return json.Unmarshal(data, v)
+}
+
+// writeFrame writes v as a big-endian uint32 length followed by its JSON encoding
+func writeFrame(w io.Writer, v interface{}) error {
+	data, err := json.Marshal(v)
+	if err != nil {
+		return fmt.Errorf("failed to marshal frame: %w", err)
+	}
+
+	frame := make([]byte, 4, 4+len(data))
+	binary.BigEndian.PutUint32(frame, uint32(len(data)))
+	frame = append(frame, data...)
+	_, err = w.Write(frame)
+	return err
+}
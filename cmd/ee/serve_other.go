@@ -0,0 +1,10 @@
+//go:build !unix || !eeserve
+
+package main
+
+import "fmt"
+
+// serve is only compiled in on Unix systems with the eeserve build tag
+func serve(_ string, _ func(args []string) error) error {
+	return fmt.Errorf("--serve is not supported by this build (build with -tags eeserve)")
+}
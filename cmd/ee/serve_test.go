@@ -0,0 +1,254 @@
+//go:build unix && eeserve
+
+package main
+
+import (
+	"bytes"
+	"encoding/binary"
+	"errors"
+	"fmt"
+	"io"
+	"net"
+	"os"
+	"path/filepath"
+	"reflect"
+	"strings"
+	"testing"
+)
+
+// shortTempDir returns a temporary directory whose paths fit in a Unix socket address
+func shortTempDir(t *testing.T) string {
+	t.Helper()
+	dir, err := os.MkdirTemp("", "ee-serve")
+	if err != nil {
+		t.Fatalf("failed to create temp dir: %v", err)
+	}
+	t.Cleanup(func() {
+		_ = os.RemoveAll(dir)
+	})
+	return dir
+}
+
+func TestFrameRoundTrip(t *testing.T) {
+	req := serveRequest{
+		Argv:  []string{"apply", "-", "--dry-run"},
+		Cwd:   "/tmp/project",
+		Stdin: "PORT=3000\n",
+		Env:   map[string]string{"EE_HOME": "/tmp/home"},
+	}
+
+	var buf bytes.Buffer
+	if err := writeFrame(&buf, req); err != nil {
+		t.Fatalf("writeFrame failed: %v", err)
+	}
+	if size := binary.BigEndian.Uint32(buf.Bytes()[:4]); int(size) != buf.Len()-4 {
+		t.Errorf("header says %d bytes, body has %d", size, buf.Len()-4)
+	}
+
+	var got serveRequest
+	if err := readFrame(&buf, &got); err != nil {
+		t.Fatalf("readFrame failed: %v", err)
+	}
+	if !reflect.DeepEqual(got, req) {
+		t.Errorf("frame did not round-trip\ngot:  %+v\nwant: %+v", got, req)
+	}
+}
+
+func TestReadFrameErrors(t *testing.T) {
+	oversized := make([]byte, 4)
+	binary.BigEndian.PutUint32(oversized, maxFrameSize+1)
+
+	truncated := make([]byte, 4, 6)
+	binary.BigEndian.PutUint32(truncated, 10)
+	truncated = append(truncated, '{', '}')
+
+	cases := map[string][]byte{
+		"short header": {0, 0},
+		"oversized":    oversized,
+		"truncated":    truncated,
+		"invalid json": append([]byte{0, 0, 0, 3}, "{x}"...),
+	}
+
+	for name, data := range cases {
+		t.Run(name, func(t *testing.T) {
+			var req serveRequest
+			if err := readFrame(bytes.NewReader(data), &req); err == nil {
+				t.Error("expected an error")
+			}
+		})
+	}
+}
+
+func TestExecuteRequestCapturesOutput(t *testing.T) {
+	large := strings.Repeat("x", 1<<20)
+
+	run := func(args []string) error {
+		input, err := io.ReadAll(os.Stdin)
+		if err != nil {
+			return err
+		}
+		fmt.Printf("args=%s stdin=%s\n", strings.Join(args, ","), input)
+		fmt.Print(large)
+		fmt.Fprint(os.Stderr, "warning\n")
+		return nil
+	}
+
+	resp, err := executeRequest(serveRequest{Argv: []string{"a", "b"}, Stdin: "piped"}, run)
+	if err != nil {
+		t.Fatalf("executeRequest failed: %v", err)
+	}
+	if resp.RC != 0 {
+		t.Errorf("expected rc 0, got %d", resp.RC)
+	}
+	if want := "args=a,b stdin=piped\n" + large; resp.Stdout != want {
+		t.Errorf("unexpected stdout of %d bytes, want %d bytes", len(resp.Stdout), len(want))
+	}
+	if resp.Stderr != "warning\n" {
+		t.Errorf("unexpected stderr: %q", resp.Stderr)
+	}
+}
+
+func TestExecuteRequestExitCodes(t *testing.T) {
+	cases := []struct {
+		name       string
+		run        func(args []string) error
+		wantRC     int
+		wantStderr string
+	}{
+		{"error", func([]string) error { return errors.New("boom") }, 1, "boom\n"},
+		{"panic", func([]string) error { panic("exploded") }, 2, "panic: exploded\n"},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			resp, err := executeRequest(serveRequest{}, tc.run)
+			if err != nil {
+				t.Fatalf("executeRequest failed: %v", err)
+			}
+			if resp.RC != tc.wantRC || resp.Stderr != tc.wantStderr {
+				t.Errorf("got rc %d stderr %q", resp.RC, resp.Stderr)
+			}
+		})
+	}
+}
+
+func TestExecuteRequestRestoresState(t *testing.T) {
+	t.Setenv("EE_SERVE_SET", "before")
+	if err := os.Unsetenv("EE_SERVE_UNSET"); err != nil {
+		t.Fatalf("failed to unset variable: %v", err)
+	}
+	workDir, err := filepath.EvalSymlinks(t.TempDir())
+	if err != nil {
+		t.Fatalf("failed to resolve temp dir: %v", err)
+	}
+	previousDir, _ := os.Getwd()
+	previousArgs := os.Args
+
+	req := serveRequest{
+		Argv: []string{"verify"},
+		Cwd:  workDir,
+		Env:  map[string]string{"EE_SERVE_SET": "during", "EE_SERVE_UNSET": "during"},
+	}
+	run := func(args []string) error {
+		cwd, _ := os.Getwd()
+		fmt.Printf("%s|%s|%s|%s",
+			cwd, os.Getenv("EE_SERVE_SET"), os.Getenv("EE_SERVE_UNSET"),
+			strings.Join(os.Args[1:], " "))
+		return nil
+	}
+
+	resp, err := executeRequest(req, run)
+	if err != nil {
+		t.Fatalf("executeRequest failed: %v", err)
+	}
+	if want := workDir + "|during|during|verify"; resp.Stdout != want {
+		t.Errorf("request state not applied: got %q, want %q", resp.Stdout, want)
+	}
+
+	if cwd, _ := os.Getwd(); cwd != previousDir {
+		t.Errorf("working directory not restored: %s", cwd)
+	}
+	if value := os.Getenv("EE_SERVE_SET"); value != "before" {
+		t.Errorf("EE_SERVE_SET not restored: %q", value)
+	}
+	if _, ok := os.LookupEnv("EE_SERVE_UNSET"); ok {
+		t.Error("EE_SERVE_UNSET should be unset again")
+	}
+	if !reflect.DeepEqual(os.Args, previousArgs) {
+		t.Errorf("os.Args not restored: %v", os.Args)
+	}
+}
+
+func TestHandleServeConn(t *testing.T) {
+	client, server := net.Pipe()
+	go handleServeConn(server, func(args []string) error {
+		fmt.Print(strings.Join(args, " "))
+		return nil
+	})
+	defer func() {
+		_ = client.Close()
+	}()
+
+	if err := writeFrame(client, serveRequest{Argv: []string{"--version"}}); err != nil {
+		t.Fatalf("failed to send request: %v", err)
+	}
+	var resp serveResponse
+	if err := readFrame(client, &resp); err != nil {
+		t.Fatalf("failed to read response: %v", err)
+	}
+	if resp.RC != 0 || resp.Stdout != "--version" {
+		t.Errorf("unexpected response: %+v", resp)
+	}
+}
+
+func TestHandleServeConnReportsBadRequest(t *testing.T) {
+	client, server := net.Pipe()
+	go handleServeConn(server, func([]string) error { return nil })
+	defer func() {
+		_ = client.Close()
+	}()
+
+	missing := filepath.Join(t.TempDir(), "missing")
+	if err := writeFrame(client, serveRequest{Cwd: missing}); err != nil {
+		t.Fatalf("failed to send request: %v", err)
+	}
+	var resp serveResponse
+	if err := readFrame(client, &resp); err != nil {
+		t.Fatalf("failed to read response: %v", err)
+	}
+	if resp.RC != 1 || !strings.Contains(resp.Stderr, missing) {
+		t.Errorf("unexpected response: %+v", resp)
+	}
+}
+
+func TestListenUnixReplacesStaleSocket(t *testing.T) {
+	sockPath := filepath.Join(shortTempDir(t), "ee.sock")
+
+	stale, err := net.Listen("unix", sockPath)
+	if err != nil {
+		t.Fatalf("failed to create socket: %v", err)
+	}
+	stale.(*net.UnixListener).SetUnlinkOnClose(false)
+	_ = stale.Close()
+
+	listener, err := listenUnix(sockPath)
+	if err != nil {
+		t.Fatalf("listenUnix failed on a stale socket: %v", err)
+	}
+	_ = listener.Close()
+}
+
+func TestListenUnixKeepsOtherFiles(t *testing.T) {
+	path := filepath.Join(shortTempDir(t), "not-a-socket")
+	if err := os.WriteFile(path, []byte("keep me"), 0o644); err != nil {
+		t.Fatalf("failed to write file: %v", err)
+	}
+
+	if listener, err := listenUnix(path); err == nil {
+		_ = listener.Close()
+		t.Fatal("expected listening on a regular file to fail")
+	}
+	if content, err := os.ReadFile(path); err != nil || string(content) != "keep me" {
+		t.Errorf("existing file was modified or removed: %q, %v", content, err)
+	}
+}
@@ -3,6 +3,7 @@ package command
 
 import (
 	"fmt"
+	"io"
 	"os"
 	"os/exec"
 	"runtime"
@@ -24,7 +25,7 @@ func NewApplyCommand(groupId string) *cobra.Command {
 	ac := &ApplyCommand{}
 
 	cmd := &cobra.Command{
-		Use:     "apply [environment-name|file-path] [-- command [args...]]",
+		Use:     "apply [environment-name|file-path|-] [-- command [args...]]",
 		Aliases: []string{"a"},
 		Short:   "Apply environment variables from .env files or project environments",
 		Long: `Apply environment variables to a new shell or run a specific command with the environment.
@@ -32,6 +33,10 @@ func NewApplyCommand(groupId string) *cobra.Command {
 This command supports multiple sources:
 - Project environments (using smart project detection from .ee file)
 - .env files (detected automatically by file path)
+- .env content on standard input (pass - as the source)
+
+Reading from standard input consumes it: a command run with - sees an empty
+standard input, and - cannot start an interactive shell.
 
 Examples:
   # Apply development environment and start new shell
@@ -46,6 +51,9 @@ Examples:
   # Apply .env file with absolute path
   ee apply /path/to/my-app/.env -- npm start
 
+  # Apply .env content piped on standard input (npm start gets no stdin)
+  cat .env.local | ee apply - -- npm start
+
   # Show what would be applied without executing
   ee apply development --dry-run
 `,
@@ -89,8 +97,20 @@ func (c *ApplyCommand) Run(cmd *cobra.Command, args []string) error {
 
 	var values map[string]string
 
-	// Detect if the argument is a file path or environment name
-	if isFilePath(envOrFile) {
+	// Detect if the argument is stdin, a file path or an environment name
+	if envOrFile == "-" {
+		// The .env content uses up stdin, so a shell would exit immediately
+		if !dryRun && len(commandArgs) == 0 {
+			return fmt.Errorf("reading from standard input (-) requires a command after -- or --dry-run")
+		}
+		values, err = c.applyStdin()
+		if err != nil {
+			return err
+		}
+		if !quiet && format != "json" {
+			printer.Info("Applying .env content from standard input")
+		}
+	} else if isFilePath(envOrFile) {
 		values, err = c.applyEnvFile(envOrFile)
 		if err != nil {
 			return err
@@ -194,6 +214,22 @@ func (c *ApplyCommand) applyEnvFile(
 	return values, nil
 }
 
+// applyStdin reads and parses .env content from standard input
+func (c *ApplyCommand) applyStdin() (map[string]string, error) {
+	content, err := io.ReadAll(os.Stdin)
+	if err != nil {
+		return nil, fmt.Errorf("failed to read standard input: %w", err)
+	}
+
+	p := parser.NewAnnotatedDotEnvParser()
+	values, _, err := p.Parse(content)
+	if err != nil {
+		return nil, fmt.Errorf("failed to parse .env content: %w", err)
+	}
+
+	return values, nil
+}
+
 // runCommandWithEnvironment runs a command with the specified environment variables
 func (c *ApplyCommand) runCommandWithEnvironment(
 	values map[string]string,
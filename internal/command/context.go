@@ -9,6 +9,10 @@ import (
 
 type commandContextKey struct{}
 
+// SkipProjectDetection is a command annotation for commands that never read the
+// project configuration, so the .ee file is not loaded before they run
+const SkipProjectDetection = "ee:skip-project-detection"
+
 // WithCommandContext returns a new context with the command context instance
 func WithCommandContext(ctx context.Context, cmdCtx *util.CommandContext) context.Context {
 	return context.WithValue(ctx, commandContextKey{}, cmdCtx)
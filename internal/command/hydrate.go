@@ -2,10 +2,8 @@
 package command
 
 import (
-	"encoding/json"
 	"fmt"
 	"os"
-	"sort"
 	"strings"
 
 	"github.com/spf13/cobra"
@@ -201,7 +199,7 @@ func (c *HydrateCommand) render(values map[string]string, format string) (string
 	case "dotenv", "env":
 		return c.renderDotenv(values), nil
 	case "json":
-		return c.renderJSON(values)
+		return c.renderJSON(values), nil
 	case "yaml", "yml":
 		return c.renderYAML(values)
 	default:
@@ -210,24 +208,11 @@ func (c *HydrateCommand) render(values map[string]string, format string) (string
 }
 
 func (c *HydrateCommand) renderDotenv(values map[string]string) string {
-	keys := sortedKeys(values)
-	var sb strings.Builder
-	for _, key := range keys {
-		value := values[key]
-		value = strings.ReplaceAll(value, "\\", "\\\\")
-		value = strings.ReplaceAll(value, "\"", "\\\"")
-		value = strings.ReplaceAll(value, "\n", "\\n")
-		sb.WriteString(fmt.Sprintf("%s=\"%s\"\n", key, value))
-	}
-	return sb.String()
+	return string(output.MarshalDotEnv(values))
 }
 
-func (c *HydrateCommand) renderJSON(values map[string]string) (string, error) {
-	data, err := json.MarshalIndent(values, "", "  ")
-	if err != nil {
-		return "", fmt.Errorf("failed to marshal JSON: %w", err)
-	}
-	return string(data) + "\n", nil
+func (c *HydrateCommand) renderJSON(values map[string]string) string {
+	return string(output.MarshalValuesJSON(values))
 }
 
 func (c *HydrateCommand) renderYAML(values map[string]string) (string, error) {
@@ -237,12 +222,3 @@ func (c *HydrateCommand) renderYAML(values map[string]string) (string, error) {
 	}
 	return string(data), nil
 }
-
-func sortedKeys(m map[string]string) []string {
-	keys := make([]string, 0, len(m))
-	for k := range m {
-		keys = append(keys, k)
-	}
-	sort.Strings(keys)
-	return keys
-}
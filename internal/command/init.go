@@ -43,16 +43,26 @@ Examples:
 
   # Initialize with inline schema variables
   ee init my-api --var "PORT:number:Server port:false:3000" --var "NODE_ENV:string:Environment:true:development"
+
+  # Initialize with inline schema variables read from a file, one definition per line
+  ee init my-api --var-file ./vars.txt
+
+  # Initialize without writing sample .env files
+  ee init my-api --no-samples
 `,
-		RunE:    ic.Run,
-		GroupID: groupId,
+		RunE:        ic.Run,
+		GroupID:     groupId,
+		Annotations: map[string]string{SkipProjectDetection: "true"},
 	}
 
 	cmd.Flags().
 		StringP("schema", "s", "", "Schema file reference (e.g., ./schema.yaml)")
 	cmd.Flags().
 		StringSlice("var", []string{}, "Add schema variable (format:name:type:title:required:default)")
+	cmd.Flags().
+		String("var-file", "", "Read schema variables from a file (one --var definition per line)")
 	cmd.Flags().BoolP("force", "f", false, "Overwrite existing .ee file")
+	cmd.Flags().Bool("no-samples", false, "Do not create sample .env files for environments")
 	cmd.Flags().BoolP("quiet", "q", false, "Suppress non-error output")
 
 	return cmd
@@ -67,7 +77,17 @@ func (c *InitCommand) Run(cmd *cobra.Command, args []string) error {
 	// Get flags
 	schemaRef, _ := cmd.Flags().GetString("schema")
 	variables, _ := cmd.Flags().GetStringSlice("var")
+	varFile, _ := cmd.Flags().GetString("var-file")
 	force, _ := cmd.Flags().GetBool("force")
+	noSamples, _ := cmd.Flags().GetBool("no-samples")
+
+	if varFile != "" {
+		fileVariables, err := readVariableDefinitions(varFile)
+		if err != nil {
+			return err
+		}
+		variables = append(variables, fileVariables...)
+	}
 
 	// Determine project name
 	var projectName string
@@ -119,14 +139,16 @@ func (c *InitCommand) Run(cmd *cobra.Command, args []string) error {
 	}
 
 	// Create sample .env files
-	err = c.createSampleEnvFiles(projectConfig)
-	if err != nil {
-		printer.Warning(fmt.Sprintf("Failed to create sample .env files: %v", err))
+	if !noSamples {
+		err = c.createSampleEnvFiles(projectConfig)
+		if err != nil {
+			printer.Warning(fmt.Sprintf("Failed to create sample .env files: %v", err))
+		}
 	}
 
 	printer.Success(fmt.Sprintf("Initialized ee project: %s", projectName))
 	printer.Info(fmt.Sprintf("Created %s configuration file", config.ProjectConfigFileName))
-	if len(projectConfig.Environments) > 0 {
+	if !noSamples && len(projectConfig.Environments) > 0 {
 		printer.Info("Created sample .env files for environments")
 	}
 
@@ -193,9 +215,10 @@ func (c *InitCommand) buildSchemaConfig(
 	return schema, nil
 }
 
-// parseVariableDefinition parses a variable definition string (name:type:title:required:default)
+// parseVariableDefinition parses a variable definition string (name:type:title:required:default).
+// The default is everything after the fourth colon, so it may itself contain colons.
 func (c *InitCommand) parseVariableDefinition(varDef string) (entities.Variable, error) {
-	parts := strings.Split(varDef, ":")
+	parts := strings.SplitN(varDef, ":", 5)
 	if len(parts) < 2 {
 		return entities.Variable{}, fmt.Errorf("format should be name:type:title:required:default")
 	}
@@ -218,10 +241,36 @@ func (c *InitCommand) parseVariableDefinition(varDef string) (entities.Variable,
 	return variable, nil
 }
 
-// createSampleEnvFiles creates sample .env files for each environment
+// readVariableDefinitions reads variable definitions from a file, one per line
+// in the --var format. Blank lines and lines starting with # are skipped.
+func readVariableDefinitions(path string) ([]string, error) {
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return nil, fmt.Errorf("failed to read variables file %s: %w", path, err)
+	}
+
+	var definitions []string
+	for _, line := range strings.Split(string(data), "\n") {
+		line = strings.TrimSpace(line)
+		if line == "" || strings.HasPrefix(line, "#") {
+			continue
+		}
+		definitions = append(definitions, line)
+	}
+
+	return definitions, nil
+}
+
+// createSampleEnvFiles creates a sample .env file for every environment that
+// does not have one yet. The schema is resolved once and shared by all files.
 func (c *InitCommand) createSampleEnvFiles(
 	projectConfig *parser.ProjectConfig,
 ) error {
+	var (
+		schemaEntity *entities.Schema
+		values       map[string]string
+	)
+
 	for envName, envDef := range projectConfig.Environments {
 		// Determine .env file from environment definition
 		envFile := envDef.Env
@@ -229,22 +278,33 @@ func (c *InitCommand) createSampleEnvFiles(
 			envFile = ".env." + envName
 		}
 
-		// Create the .env file if it doesn't exist
-		if _, err := os.Stat(envFile); os.IsNotExist(err) {
-			err := c.createSampleEnvFile(envFile, projectConfig.Schema)
+		// Only create the .env file if it doesn't exist
+		if _, err := os.Stat(envFile); !os.IsNotExist(err) {
+			continue
+		}
+
+		if schemaEntity == nil {
+			var err error
+			schemaEntity, values, err = c.sampleSchema(projectConfig.Schema)
 			if err != nil {
 				return fmt.Errorf("failed to create %s: %w", envFile, err)
 			}
 		}
+
+		// Use the reusable dotenv parser to export the file
+		dotenvParser := parser.NewAnnotatedDotEnvParser()
+		if err := dotenvParser.ExportAnnotatedDotEnv(values, schemaEntity, envFile); err != nil {
+			return fmt.Errorf("failed to create %s: %w", envFile, err)
+		}
 	}
 	return nil
 }
 
-// createSampleEnvFile creates a sample .env file with schema annotations
-func (c *InitCommand) createSampleEnvFile(
-	filename string,
+// sampleSchema builds the annotated schema and default values written to
+// sample .env files
+func (c *InitCommand) sampleSchema(
 	schema parser.ProjectConfigSchema,
-) error {
+) (*entities.Schema, map[string]string, error) {
 	var variables map[string]entities.Variable
 
 	// Handle schema reference vs inline schema
@@ -252,7 +312,7 @@ func (c *InitCommand) createSampleEnvFile(
 		// Try to load the referenced schema file
 		loaded, err := entities.ResolveSchemaRef(schema.Ref)
 		if err != nil {
-			return fmt.Errorf("failed to load schema '%s': %w", schema.Ref, err)
+			return nil, nil, fmt.Errorf("failed to load schema '%s': %w", schema.Ref, err)
 		}
 		variables = make(map[string]entities.Variable)
 		for _, v := range loaded.Variables {
@@ -282,9 +342,7 @@ func (c *InitCommand) createSampleEnvFile(
 		schemaEntity.Description = "inline"
 	}
 
-	// Use the reusable dotenv parser to export the file
-	dotenvParser := parser.NewAnnotatedDotEnvParser()
-	return dotenvParser.ExportAnnotatedDotEnv(values, schemaEntity, filename)
+	return schemaEntity, values, nil
 }
 
 // GetCurrentProject reads the project name from .ee file in current directory
@@ -0,0 +1,37 @@
+package command
+
+import "testing"
+
+func TestParseVariableDefinition(t *testing.T) {
+	ic := &InitCommand{}
+
+	cases := []struct {
+		def          string
+		wantTitle    string
+		wantRequired bool
+		wantDefault  string
+	}{
+		{"PORT:number", "", false, ""},
+		{"PORT:number:Server port:false:3000", "Server port", false, "3000"},
+		{"API_KEY:string:API key:true", "API key", true, ""},
+		{
+			"DATABASE_URL:url:Database:false:postgres://localhost:5432/db",
+			"Database", false, "postgres://localhost:5432/db",
+		},
+	}
+
+	for _, tc := range cases {
+		variable, err := ic.parseVariableDefinition(tc.def)
+		if err != nil {
+			t.Fatalf("%q: unexpected error: %v", tc.def, err)
+		}
+		if variable.Title != tc.wantTitle || variable.Required != tc.wantRequired ||
+			variable.Default != tc.wantDefault {
+			t.Errorf("%q: got %+v", tc.def, variable)
+		}
+	}
+
+	if _, err := ic.parseVariableDefinition("PORT"); err == nil {
+		t.Error("expected an error for a definition without a type")
+	}
+}
@@ -5,7 +5,6 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
-	"regexp"
 	"sort"
 	"strings"
 
@@ -32,6 +31,7 @@ When run without subcommands, displays all environment variables in the current
 		RunE:          rc.Run,
 		SilenceUsage:  true, // Don't show usage on RunE errors
 		SilenceErrors: true,
+		Annotations:   map[string]string{SkipProjectDetection: "true"},
 	}
 
 	// Add flags for filtering and formatting
@@ -54,17 +54,18 @@ func (c *RootCommand) Run(cmd *cobra.Command, args []string) error {
 	// Get all environment variables
 	envVars := os.Environ()
 
+	// Split the filter once, not once per variable
+	var patterns []string
+	if filter != "" {
+		patterns = c.parsePatterns(filter)
+	}
+
 	// Parse into key-value map
-	envMap := make(map[string]string)
+	envMap := make(map[string]string, len(envVars))
 	for _, env := range envVars {
-		parts := strings.SplitN(env, "=", 2)
-		if len(parts) == 2 {
-			key := parts[0]
-			value := parts[1]
-
+		if key, value, ok := strings.Cut(env, "="); ok {
 			// Apply filter if specified
 			if filter != "" {
-				patterns := c.parsePatterns(filter)
 				matched, err := c.matchesAnyPattern(key, patterns)
 				if err != nil {
 					return fmt.Errorf("invalid filter pattern '%s': %w", filter, err)
@@ -101,9 +102,9 @@ func (c *RootCommand) Run(cmd *cobra.Command, args []string) error {
 // parsePatterns splits the filter string into individual patterns
 // Supports comma (,), pipe (|), and forward slash (/) as separators
 func (c *RootCommand) parsePatterns(filter string) []string {
-	// Use regex to split on comma, pipe, or forward slash
-	re := regexp.MustCompile(`[,|/]`)
-	patterns := re.Split(filter, -1)
+	patterns := strings.FieldsFunc(filter, func(r rune) bool {
+		return r == ',' || r == '|' || r == '/'
+	})
 
 	// Trim whitespace from each pattern
 	for i, pattern := range patterns {
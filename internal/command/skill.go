@@ -152,8 +152,9 @@ Examples:
   # Print the guide to stdout instead of writing a file
   ee skill claude --print
 `,
-		RunE:    sc.Run,
-		GroupID: groupId,
+		RunE:        sc.Run,
+		GroupID:     groupId,
+		Annotations: map[string]string{SkipProjectDetection: "true"},
 	}
 
 	cmd.Flags().BoolP("force", "f", false, "Overwrite an existing skill file")
@@ -339,42 +339,7 @@ func (c *VerifyCommand) parseEnvFile(filename string) (map[string]string, error)
 		return nil, fmt.Errorf("failed to read file: %w", err)
 	}
 
-	result := make(map[string]string)
-	lines := strings.Split(string(content), "\n")
-
-	for lineNum, line := range lines {
-		line = strings.TrimSpace(line)
-
-		// Skip empty lines and comments
-		if line == "" || strings.HasPrefix(line, "#") {
-			continue
-		}
-
-		// Parse KEY=VALUE format
-		parts := strings.SplitN(line, "=", 2)
-		if len(parts) != 2 {
-			return nil, fmt.Errorf("invalid line %d: %s", lineNum+1, line)
-		}
-
-		key := strings.TrimSpace(parts[0])
-		value := strings.TrimSpace(parts[1])
-
-		// Remove surrounding quotes if present
-		if len(value) >= 2 {
-			if (strings.HasPrefix(value, "\"") && strings.HasSuffix(value, "\"")) ||
-				(strings.HasPrefix(value, "'") && strings.HasSuffix(value, "'")) {
-				value = value[1 : len(value)-1]
-			}
-		}
-
-		if key == "" {
-			return nil, fmt.Errorf("empty variable name on line %d", lineNum+1)
-		}
-
-		result[key] = value
-	}
-
-	return result, nil
+	return parser.ParseDotEnv(content)
 }
 
 // reportResults reports verification results
@@ -2,24 +2,67 @@
 package entities
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"os"
 	"path/filepath"
+	"slices"
 	"strings"
+	"sync"
 
 	"gopkg.in/yaml.v3"
 )
 
+// schemaCacheEntry is a parsed schema together with the file content it was parsed from
+type schemaCacheEntry struct {
+	data   []byte
+	schema *Schema
+}
+
+// schemaCache memoizes parsed schemas by absolute path, so a long-running ee
+// process (see ee --serve) parses each schema file once until it changes
+var schemaCache sync.Map
+
 // LoadSchemaFromFile loads a schema from a YAML or JSON file.
 // The path can be absolute or relative to the current working directory.
+// The file is read on every call, but parsing is skipped when its content is
+// byte-for-byte the same as the last parse of that path; each call returns
+// its own copy.
 func LoadSchemaFromFile(path string) (*Schema, error) {
-	data, err := os.ReadFile(path)
+	absPath, err := filepath.Abs(path)
+	if err != nil {
+		return nil, fmt.Errorf("failed to resolve schema path %s: %w", path, err)
+	}
+
+	data, err := os.ReadFile(absPath)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read schema file %s: %w", path, err)
 	}
 
-	var schema Schema
+	if cached, ok := schemaCache.Load(absPath); ok {
+		entry := cached.(schemaCacheEntry)
+		if bytes.Equal(entry.data, data) {
+			return entry.schema.clone(), nil
+		}
+	}
+
+	schema, err := parseSchema(path, data)
+	if err != nil {
+		return nil, err
+	}
+
+	schemaCache.Store(absPath, schemaCacheEntry{data: data, schema: schema})
+
+	return schema.clone(), nil
+}
+
+// parseSchema parses the content of the schema file at path
+func parseSchema(path string, data []byte) (*Schema, error) {
+	var (
+		schema Schema
+		err    error
+	)
 
 	ext := strings.ToLower(filepath.Ext(path))
 	switch ext {
@@ -28,9 +71,11 @@ func LoadSchemaFromFile(path string) (*Schema, error) {
 	case ".json":
 		err = json.Unmarshal(data, &schema)
 	default:
-		// Try YAML first, then JSON
-		if err = yaml.Unmarshal(data, &schema); err != nil {
+		// Pick the parser once from the content
+		if looksLikeJSON(data) {
 			err = json.Unmarshal(data, &schema)
+		} else {
+			err = yaml.Unmarshal(data, &schema)
 		}
 	}
 	if err != nil {
@@ -44,6 +89,29 @@ func LoadSchemaFromFile(path string) (*Schema, error) {
 	return &schema, nil
 }
 
+// looksLikeJSON reports whether data is a JSON object: after an optional
+// UTF-8 byte order mark it opens with '{' followed by a quoted key or '}'.
+// Flow-style YAML such as {name: api} has unquoted keys and is left to the
+// YAML decoder.
+func looksLikeJSON(data []byte) bool {
+	const whitespace = " \t\r\n"
+	data = bytes.TrimPrefix(data, []byte("\xef\xbb\xbf"))
+	data = bytes.TrimLeft(data, whitespace)
+	if len(data) == 0 || data[0] != '{' {
+		return false
+	}
+	data = bytes.TrimLeft(data[1:], whitespace)
+	return len(data) > 0 && (data[0] == '"' || data[0] == '}')
+}
+
+// clone returns a copy of the schema that shares no slices with the original
+func (s *Schema) clone() *Schema {
+	clone := *s
+	clone.Variables = slices.Clone(s.Variables)
+	clone.Extends = slices.Clone(s.Extends)
+	return &clone
+}
+
 // ResolveSchemaRef resolves a schema reference string to a file path and loads it.
 // Supported formats:
 //   - "file://path/to/schema.yaml" — explicit file reference
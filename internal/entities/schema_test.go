@@ -0,0 +1,91 @@
+package entities
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+func writeSchemaFile(t *testing.T, path, content string, modTime time.Time) {
+	t.Helper()
+	if err := os.WriteFile(path, []byte(content), 0o644); err != nil {
+		t.Fatalf("failed to write schema: %v", err)
+	}
+	if err := os.Chtimes(path, modTime, modTime); err != nil {
+		t.Fatalf("failed to set schema mtime: %v", err)
+	}
+}
+
+func TestLoadSchemaFromFileReloadsChangedFile(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "schema.yaml")
+	modTime := time.Now().Add(-time.Hour)
+
+	writeSchemaFile(t, path, "name: first\nvariables:\n  - name: PORT\n    type: number\n", modTime)
+	schema, err := LoadSchemaFromFile(path)
+	if err != nil {
+		t.Fatalf("LoadSchemaFromFile failed: %v", err)
+	}
+	if schema.Name != "first" || len(schema.Variables) != 1 {
+		t.Fatalf("unexpected schema: %+v", schema)
+	}
+
+	// Mutating a returned schema must not affect later loads
+	schema.Variables[0].Name = "CHANGED"
+	again, err := LoadSchemaFromFile(path)
+	if err != nil {
+		t.Fatalf("LoadSchemaFromFile failed: %v", err)
+	}
+	if again.Variables[0].Name != "PORT" {
+		t.Errorf("cached schema was modified through a returned copy")
+	}
+
+	// A rewrite of the same size within the same timestamp must not be missed
+	writeSchemaFile(t, path, "name: fixed\nvariables:\n  - name: PORT\n    type: number\n", modTime)
+	sameSize, err := LoadSchemaFromFile(path)
+	if err != nil {
+		t.Fatalf("LoadSchemaFromFile failed: %v", err)
+	}
+	if sameSize.Name != "fixed" {
+		t.Errorf("expected same-size rewrite to be reloaded, got %+v", sameSize)
+	}
+
+	writeSchemaFile(t, path, "name: second\nvariables: []\n", modTime.Add(time.Minute))
+	updated, err := LoadSchemaFromFile(path)
+	if err != nil {
+		t.Fatalf("LoadSchemaFromFile failed: %v", err)
+	}
+	if updated.Name != "second" || len(updated.Variables) != 0 {
+		t.Errorf("expected reloaded schema, got %+v", updated)
+	}
+}
+
+func TestLoadSchemaFromFileDetectsFormatWithoutExtension(t *testing.T) {
+	dir := t.TempDir()
+	cases := map[string]string{
+		// The YAML decoder rejects duplicate keys, so this only loads as JSON,
+		// where the last value wins
+		"json-schema": "\n  {\"name\": \"draft\", \"name\": \"api\", " +
+			"\"variables\": [{\"name\": \"PORT\", \"type\": \"number\"}]}",
+		"yaml-schema":      "name: api\nvariables:\n  - name: PORT\n    type: number\n",
+		"yaml-flow-schema": "{ name: api, variables: [{name: PORT, type: number}]}\n",
+	}
+
+	for filename, content := range cases {
+		t.Run(filename, func(t *testing.T) {
+			path := filepath.Join(dir, filename)
+			if err := os.WriteFile(path, []byte(content), 0o644); err != nil {
+				t.Fatalf("failed to write schema: %v", err)
+			}
+
+			schema, err := LoadSchemaFromFile(path)
+			if err != nil {
+				t.Fatalf("LoadSchemaFromFile failed: %v", err)
+			}
+			if schema.Name != "api" || len(schema.Variables) != 1 ||
+				schema.Variables[0].Name != "PORT" {
+				t.Errorf("unexpected schema: %+v", schema)
+			}
+		})
+	}
+}
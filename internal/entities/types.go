@@ -1,6 +1,8 @@
 // Package entities defines data structures for ee schemas and variables.
 package entities
 
+import "regexp"
+
 // Variable represents a single environment variable definition in the schema
 type Variable struct {
 	Name     string `json:"name"              yaml:"name"`              // Variable name (e.g., DATABASE_URL)
@@ -11,6 +13,15 @@ type Variable struct {
 	Required bool   `json:"required"          yaml:"required"`          // Whether variable is required
 }
 
+// Pattern returns the compiled Regex of the variable, or nil if it has none.
+// Patterns are compiled once per process and shared by all variables using them.
+func (v *Variable) Pattern() (*regexp.Regexp, error) {
+	if v.Regex == "" {
+		return nil, nil
+	}
+	return compilePattern(v.Regex)
+}
+
 // Schema represents a schema definition loaded from a file
 type Schema struct {
 	Name        string     `json:"name"                  yaml:"name"`
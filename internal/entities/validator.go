@@ -4,18 +4,34 @@ package entities
 import (
 	"fmt"
 	"regexp"
+	"sync"
 )
 
-// Validator handles schema validation logic
-type Validator struct {
-	compiledRegexes map[string]*regexp.Regexp
+// compiledPatterns caches compiled variable regex patterns by source string.
+// It is shared by all validators so each pattern is compiled once per process.
+var compiledPatterns sync.Map
+
+// compilePattern returns the compiled form of pattern, compiling it on first use
+func compilePattern(pattern string) (*regexp.Regexp, error) {
+	if cached, ok := compiledPatterns.Load(pattern); ok {
+		return cached.(*regexp.Regexp), nil
+	}
+
+	compiled, err := regexp.Compile(pattern)
+	if err != nil {
+		return nil, err
+	}
+
+	actual, _ := compiledPatterns.LoadOrStore(pattern, compiled)
+	return actual.(*regexp.Regexp), nil
 }
 
+// Validator handles schema validation logic
+type Validator struct{}
+
 // NewValidator creates a new validator instance
 func NewValidator() *Validator {
-	return &Validator{
-		compiledRegexes: make(map[string]*regexp.Regexp),
-	}
+	return &Validator{}
 }
 
 // validateVariable checks if a variable definition is valid
@@ -33,14 +49,8 @@ func (v *Validator) validateVariable(variable *Variable) error {
 	}
 
 	// Compile and validate regex if provided
-	if variable.Regex != "" {
-		if _, exists := v.compiledRegexes[variable.Regex]; !exists {
-			compiled, err := regexp.Compile(variable.Regex)
-			if err != nil {
-				return fmt.Errorf("invalid regex pattern: %w", err)
-			}
-			v.compiledRegexes[variable.Regex] = compiled
-		}
+	if _, err := variable.Pattern(); err != nil {
+		return fmt.Errorf("invalid regex pattern: %w", err)
 	}
 
 	// Validate default value if provided
@@ -71,12 +81,12 @@ func (v *Validator) ValidateValue(variable *Variable, value string) error {
 	}
 
 	// Check regex pattern if defined
-	if variable.Regex != "" {
-		if regex, exists := v.compiledRegexes[variable.Regex]; exists {
-			if !regex.MatchString(value) {
-				return fmt.Errorf("value does not match regex pattern")
-			}
-		}
+	regex, err := variable.Pattern()
+	if err != nil {
+		return fmt.Errorf("invalid regex pattern: %w", err)
+	}
+	if regex != nil && !regex.MatchString(value) {
+		return fmt.Errorf("value does not match regex pattern")
 	}
 
 	return nil
@@ -88,8 +98,9 @@ func (v *Validator) ValidateSchema(schema *Schema) error {
 		return fmt.Errorf("schema name cannot be empty")
 	}
 
-	for _, variable := range schema.Variables {
-		if err := v.validateVariable(&variable); err != nil {
+	for i := range schema.Variables {
+		variable := &schema.Variables[i]
+		if err := v.validateVariable(variable); err != nil {
 			return fmt.Errorf("invalid variable %s: %w", variable.Name, err)
 		}
 	}
@@ -0,0 +1,20 @@
+package entities
+
+import "testing"
+
+func TestValidateValueRegex(t *testing.T) {
+	v := NewValidator()
+	variable := &Variable{Name: "TAG", Type: "string", Regex: `^v\d+$`}
+
+	if err := v.ValidateValue(variable, "v12"); err != nil {
+		t.Errorf("expected v12 to match: %v", err)
+	}
+	if err := v.ValidateValue(variable, "latest"); err == nil {
+		t.Error("expected latest not to match")
+	}
+
+	invalid := &Variable{Name: "BAD", Type: "string", Regex: "("}
+	if err := v.ValidateValue(invalid, "anything"); err == nil {
+		t.Error("expected an error for an invalid pattern")
+	}
+}
@@ -0,0 +1,82 @@
+package output
+
+import (
+	"bytes"
+	"sort"
+)
+
+// MarshalDotEnv encodes environment variable values as KEY="value" lines
+// sorted by key. Backslashes, double quotes and newlines in values are
+// escaped so the result can be read back as a .env file.
+func MarshalDotEnv(values map[string]string) []byte {
+	keys, size := sortedKeysAndSize(values, len(`=""`)+1)
+
+	var buf bytes.Buffer
+	buf.Grow(size)
+	for _, key := range keys {
+		buf.WriteString(key)
+		buf.WriteString(`="`)
+		writeEscaped(&buf, values[key], true)
+		buf.WriteString("\"\n")
+	}
+	return buf.Bytes()
+}
+
+// MarshalExport encodes environment variable values as shell export
+// statements sorted by key. Double quotes in values are escaped.
+func MarshalExport(values map[string]string) []byte {
+	keys, size := sortedKeysAndSize(values, len(`export =""`)+1)
+
+	var buf bytes.Buffer
+	buf.Grow(size)
+	for _, key := range keys {
+		buf.WriteString("export ")
+		buf.WriteString(key)
+		buf.WriteString(`="`)
+		writeEscaped(&buf, values[key], false)
+		buf.WriteString("\"\n")
+	}
+	return buf.Bytes()
+}
+
+// sortedKeysAndSize returns the sorted keys of values together with an
+// estimate of the encoded size, given the fixed overhead of each line
+func sortedKeysAndSize(values map[string]string, lineOverhead int) ([]string, int) {
+	keys := make([]string, 0, len(values))
+	size := 0
+	for key, value := range values {
+		keys = append(keys, key)
+		size += len(key) + len(value) + lineOverhead
+	}
+	sort.Strings(keys)
+	return keys, size
+}
+
+// writeEscaped writes s with double quotes escaped. When full is set,
+// backslashes and newlines are escaped as well.
+func writeEscaped(buf *bytes.Buffer, s string, full bool) {
+	start := 0
+	for i := 0; i < len(s); i++ {
+		var escaped string
+		switch s[i] {
+		case '"':
+			escaped = `\"`
+		case '\\':
+			if !full {
+				continue
+			}
+			escaped = `\\`
+		case '\n':
+			if !full {
+				continue
+			}
+			escaped = `\n`
+		default:
+			continue
+		}
+		buf.WriteString(s[start:i])
+		buf.WriteString(escaped)
+		start = i + 1
+	}
+	buf.WriteString(s[start:])
+}
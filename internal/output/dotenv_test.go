@@ -0,0 +1,50 @@
+package output
+
+import (
+	"fmt"
+	"sort"
+	"strings"
+	"testing"
+)
+
+var escapeCases = map[string]string{
+	"PLAIN":     "value",
+	"EMPTY":     "",
+	"QUOTED":    `say "hi"`,
+	"BACKSLASH": `C:\path\to`,
+	"MULTILINE": "line1\nline2",
+	"MIXED":     "a\\\"b\nc\"",
+}
+
+// formatLines renders values one line per sorted key after applying replacer
+func formatLines(values map[string]string, line string, replacer *strings.Replacer) string {
+	keys := make([]string, 0, len(values))
+	for key := range values {
+		keys = append(keys, key)
+	}
+	sort.Strings(keys)
+
+	var sb strings.Builder
+	for _, key := range keys {
+		sb.WriteString(fmt.Sprintf(line, key, replacer.Replace(values[key])))
+	}
+	return sb.String()
+}
+
+func TestMarshalDotEnv(t *testing.T) {
+	want := formatLines(escapeCases, "%s=\"%s\"\n",
+		strings.NewReplacer(`\`, `\\`, `"`, `\"`, "\n", `\n`))
+	if got := string(MarshalDotEnv(escapeCases)); got != want {
+		t.Errorf("unexpected output\ngot:\n%s\nwant:\n%s", got, want)
+	}
+	if got := MarshalDotEnv(nil); len(got) != 0 {
+		t.Errorf("expected no output for no values, got %q", got)
+	}
+}
+
+func TestMarshalExport(t *testing.T) {
+	want := formatLines(escapeCases, "export %s=\"%s\"\n", strings.NewReplacer(`"`, `\"`))
+	if got := string(MarshalExport(escapeCases)); got != want {
+		t.Errorf("unexpected output\ngot:\n%s\nwant:\n%s", got, want)
+	}
+}
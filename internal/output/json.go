@@ -0,0 +1,103 @@
+package output
+
+import (
+	"bytes"
+	"sort"
+	"unicode/utf8"
+)
+
+const hexDigits = "0123456789abcdef"
+
+// MarshalValuesJSON encodes environment variable values as an indented JSON
+// object with sorted keys and a trailing newline. The output is byte-for-byte
+// what json.Encoder with SetIndent("", "  ") produces for a map[string]string,
+// but it is written directly instead of going through reflection.
+func MarshalValuesJSON(values map[string]string) []byte {
+	if len(values) == 0 {
+		return []byte("{}\n")
+	}
+
+	keys := make([]string, 0, len(values))
+	size := 4
+	for key, value := range values {
+		keys = append(keys, key)
+		size += len(key) + len(value) + 10
+	}
+	sort.Strings(keys)
+
+	var buf bytes.Buffer
+	buf.Grow(size)
+	buf.WriteString("{\n")
+	for i, key := range keys {
+		buf.WriteString("  ")
+		writeJSONString(&buf, key)
+		buf.WriteString(": ")
+		writeJSONString(&buf, values[key])
+		if i < len(keys)-1 {
+			buf.WriteByte(',')
+		}
+		buf.WriteByte('\n')
+	}
+	buf.WriteString("}\n")
+
+	return buf.Bytes()
+}
+
+// writeJSONString writes s as a JSON string literal using the same escaping
+// rules as encoding/json, including HTML-safe escaping of <, > and &
+func writeJSONString(buf *bytes.Buffer, s string) {
+	buf.WriteByte('"')
+	start := 0
+	for i := 0; i < len(s); {
+		if b := s[i]; b < utf8.RuneSelf {
+			if b >= 0x20 && b != '"' && b != '\\' && b != '<' && b != '>' && b != '&' {
+				i++
+				continue
+			}
+			buf.WriteString(s[start:i])
+			switch b {
+			case '"', '\\':
+				buf.WriteByte('\\')
+				buf.WriteByte(b)
+			case '\b':
+				buf.WriteString(`\b`)
+			case '\f':
+				buf.WriteString(`\f`)
+			case '\n':
+				buf.WriteString(`\n`)
+			case '\r':
+				buf.WriteString(`\r`)
+			case '\t':
+				buf.WriteString(`\t`)
+			default:
+				buf.WriteString(`\u00`)
+				buf.WriteByte(hexDigits[b>>4])
+				buf.WriteByte(hexDigits[b&0xF])
+			}
+			i++
+			start = i
+			continue
+		}
+
+		r, size := utf8.DecodeRuneInString(s[i:])
+		if r == utf8.RuneError && size == 1 {
+			// Invalid UTF-8 is replaced, as encoding/json does
+			buf.WriteString(s[start:i])
+			buf.WriteString(`\ufffd`)
+			i += size
+			start = i
+			continue
+		}
+		if r == '\u2028' || r == '\u2029' {
+			buf.WriteString(s[start:i])
+			buf.WriteString(`\u202`)
+			buf.WriteByte(hexDigits[r&0xF])
+			i += size
+			start = i
+			continue
+		}
+		i += size
+	}
+	buf.WriteString(s[start:])
+	buf.WriteByte('"')
+}
@@ -3,12 +3,10 @@
 package output
 
 import (
-	"encoding/json"
 	"fmt"
 	"io"
 	"os"
 	"sort"
-	"strings"
 
 	"github.com/pterm/pterm"
 )
@@ -170,49 +168,20 @@ func (p *Printer) printValuesTable(values map[string]string) error {
 	return pterm.DefaultTable.WithHasHeader().WithData(tableData).Render()
 }
 
-// printJSON prints any object as JSON
-func (p *Printer) printJSON(obj interface{}) error {
-	encoder := json.NewEncoder(p.writer)
-	encoder.SetIndent("", "  ")
-	return encoder.Encode(obj)
+// printJSON prints environment variable values as an indented JSON object
+func (p *Printer) printJSON(values map[string]string) error {
+	_, err := p.writer.Write(MarshalValuesJSON(values))
+	return err
 }
 
 // PrintEnvironmentExport prints environment variables in export format
 func (p *Printer) PrintEnvironmentExport(values map[string]string) error {
-	// Sort keys for consistent output
-	keys := make([]string, 0, len(values))
-	for key := range values {
-		keys = append(keys, key)
-	}
-	sort.Strings(keys)
-
-	for _, key := range keys {
-		value := values[key]
-		// Escape quotes in value
-		value = strings.ReplaceAll(value, "\"", "\\\"")
-		p.printf("export %s=\"%s\"\n", key, value)
-	}
-
-	return nil
+	_, err := p.writer.Write(MarshalExport(values))
+	return err
 }
 
 // PrintDotEnv prints environment variables in .env format
 func (p *Printer) PrintDotEnv(values map[string]string) error {
-	// Sort keys for consistent output
-	keys := make([]string, 0, len(values))
-	for key := range values {
-		keys = append(keys, key)
-	}
-	sort.Strings(keys)
-
-	for _, key := range keys {
-		value := values[key]
-		// Escape quotes and newlines in value
-		value = strings.ReplaceAll(value, "\\", "\\\\")
-		value = strings.ReplaceAll(value, "\"", "\\\"")
-		value = strings.ReplaceAll(value, "\n", "\\n")
-		p.printf("%s=\"%s\"\n", key, value)
-	}
-
-	return nil
+	_, err := p.writer.Write(MarshalDotEnv(values))
+	return err
 }
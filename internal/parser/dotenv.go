@@ -2,7 +2,7 @@
 package parser
 
 import (
-	"bufio"
+	"bytes"
 	"fmt"
 	"os"
 	"strings"
@@ -20,28 +20,33 @@ func NewAnnotatedDotEnvParser() *AnnotatedDotEnvParser {
 
 // ParseFile parses an annotated .env file and returns both the values and extracted schema
 func (p *AnnotatedDotEnvParser) ParseFile(path string) (map[string]string, entities.Schema, error) {
-	file, err := os.Open(path)
+	content, err := os.ReadFile(path)
 	if err != nil {
 		return nil, entities.Schema{}, fmt.Errorf("failed to open .env file: %w", err)
 	}
-	defer func() {
-		if closeErr := file.Close(); closeErr != nil {
-			// Log the error but don't override the main error
-		}
-	}()
+	return p.Parse(content)
+}
 
+// Parse parses annotated .env content and returns both the values and extracted schema.
+// The content is scanned once line by line; variables keep their order of appearance.
+func (p *AnnotatedDotEnvParser) Parse(content []byte) (map[string]string, entities.Schema, error) {
 	values := make(map[string]string)
-	variables := make(map[string]entities.Variable)
+	var varSlice []entities.Variable
+	varIndex := make(map[string]int)
 
-	scanner := bufio.NewScanner(file)
 	lineNum := 0
-
 	currentVarAnnotations := make(map[string]string)
 	var schemaRef string
 
-	for scanner.Scan() {
+	for len(content) > 0 {
 		lineNum++
-		line := strings.TrimSpace(scanner.Text())
+		var raw []byte
+		if i := bytes.IndexByte(content, '\n'); i >= 0 {
+			raw, content = content[:i], content[i+1:]
+		} else {
+			raw, content = content, nil
+		}
+		line := strings.TrimSpace(string(raw))
 
 		// Skip empty lines
 		if line == "" {
@@ -49,19 +54,19 @@ func (p *AnnotatedDotEnvParser) ParseFile(path string) (map[string]string, entit
 		}
 
 		// Handle schema reference comment
-		if strings.HasPrefix(line, "# schema:") {
-			schemaRef = strings.TrimSpace(strings.TrimPrefix(line, "# schema:"))
+		if ref, ok := strings.CutPrefix(line, "# schema:"); ok {
+			schemaRef = strings.TrimSpace(ref)
 			continue
 		}
 
 		// Handle variable annotation comments
-		if strings.HasPrefix(line, "#") {
+		if line[0] == '#' {
 			p.parseAnnotationComment(line, currentVarAnnotations)
 			continue
 		}
 
 		// Handle KEY=VALUE lines
-		if strings.Contains(line, "=") {
+		if strings.IndexByte(line, '=') >= 0 {
 			key, value, err := p.parseKeyValue(line, lineNum)
 			if err != nil {
 				return nil, entities.Schema{}, err
@@ -69,26 +74,21 @@ func (p *AnnotatedDotEnvParser) ParseFile(path string) (map[string]string, entit
 
 			values[key] = value
 
-			// Create variable definition from annotations
+			// Create variable definition from annotations; a repeated key
+			// replaces the earlier definition in place
 			variable := p.createVariableFromAnnotations(key, currentVarAnnotations)
-			variables[key] = variable
+			if idx, exists := varIndex[key]; exists {
+				varSlice[idx] = variable
+			} else {
+				varIndex[key] = len(varSlice)
+				varSlice = append(varSlice, variable)
+			}
 
 			// Clear annotations for next variable
-			currentVarAnnotations = make(map[string]string)
+			clear(currentVarAnnotations)
 		}
 	}
 
-	if err := scanner.Err(); err != nil {
-		return nil, entities.Schema{}, fmt.Errorf("error reading .env file: %w", err)
-	}
-
-	// Create schema from extracted variables
-	// Convert map to slice for Schema.Variables field
-	varSlice := make([]entities.Variable, 0, len(variables))
-	for _, variable := range variables {
-		varSlice = append(varSlice, variable)
-	}
-
 	schema := entities.Schema{
 		Description: "Schema extracted from .env file",
 		Variables:   varSlice,
@@ -104,6 +104,49 @@ func (p *AnnotatedDotEnvParser) ParseFile(path string) (map[string]string, entit
 	return values, schema, nil
 }
 
+// ParseDotEnv parses plain KEY=VALUE .env content. Blank lines and lines
+// starting with # are skipped, and one pair of matching surrounding quotes is
+// removed from values. It scans the raw bytes and converts only each key and
+// value to a string.
+func ParseDotEnv(data []byte) (map[string]string, error) {
+	result := make(map[string]string, bytes.Count(data, []byte{'\n'})+1)
+
+	for lineNum := 1; len(data) > 0; lineNum++ {
+		var line []byte
+		if i := bytes.IndexByte(data, '\n'); i >= 0 {
+			line, data = data[:i], data[i+1:]
+		} else {
+			line, data = data, nil
+		}
+
+		// Skip empty lines and comments
+		line = bytes.TrimSpace(line)
+		if len(line) == 0 || line[0] == '#' {
+			continue
+		}
+
+		eq := bytes.IndexByte(line, '=')
+		if eq < 0 {
+			return nil, fmt.Errorf("invalid line %d: %s", lineNum, line)
+		}
+
+		key := bytes.TrimSpace(line[:eq])
+		if len(key) == 0 {
+			return nil, fmt.Errorf("empty variable name on line %d", lineNum)
+		}
+
+		// Remove surrounding quotes if present
+		value := bytes.TrimSpace(line[eq+1:])
+		if n := len(value); n >= 2 && (value[0] == '"' || value[0] == '\'') && value[n-1] == value[0] {
+			value = value[1 : n-1]
+		}
+
+		result[string(key)] = string(value)
+	}
+
+	return result, nil
+}
+
 // parseAnnotationComment parses a comment line for variable annotations
 func (p *AnnotatedDotEnvParser) parseAnnotationComment(
 	line string,
@@ -118,27 +161,24 @@ func (p *AnnotatedDotEnvParser) parseAnnotationComment(
 	}
 
 	// Parse key: value format
-	parts := strings.SplitN(content, ":", 2)
-	if len(parts) != 2 {
+	key, value, ok := strings.Cut(content, ":")
+	if !ok {
 		// Ignore non-annotation comments
 		return
 	}
 
-	key := strings.TrimSpace(parts[0])
-	value := strings.TrimSpace(parts[1])
-
-	annotations[key] = value
+	annotations[strings.TrimSpace(key)] = strings.TrimSpace(value)
 }
 
 // parseKeyValue parses a KEY=VALUE line
 func (p *AnnotatedDotEnvParser) parseKeyValue(line string, lineNum int) (string, string, error) {
-	parts := strings.SplitN(line, "=", 2)
-	if len(parts) != 2 {
+	key, value, ok := strings.Cut(line, "=")
+	if !ok {
 		return "", "", fmt.Errorf("line %d: invalid format, expected KEY=VALUE", lineNum)
 	}
 
-	key := strings.TrimSpace(parts[0])
-	value := strings.TrimSpace(parts[1])
+	key = strings.TrimSpace(key)
+	value = strings.TrimSpace(value)
 
 	// Remove surrounding quotes if present
 	if len(value) >= 2 {
@@ -217,18 +257,24 @@ func (p *AnnotatedDotEnvParser) ExportAnnotatedDotEnv(
 		}
 	}
 
+	// Index schema variables by name once instead of scanning them per value
+	var variablesByName map[string]*entities.Variable
+	if schema != nil {
+		variablesByName = make(map[string]*entities.Variable, len(schema.Variables))
+		for i := range schema.Variables {
+			variable := &schema.Variables[i]
+			if _, exists := variablesByName[variable.Name]; !exists {
+				variablesByName[variable.Name] = variable
+			}
+		}
+	}
+
 	// Write variables with annotations
 	for key, value := range values {
 		// Write annotations if schema is available
-		if schema != nil {
-			// Find variable in schema by name
-			for _, variable := range schema.Variables {
-				if variable.Name == key {
-					if err := p.writeVariableAnnotations(file, variable); err != nil {
-						return err
-					}
-					break
-				}
+		if variable, ok := variablesByName[key]; ok {
+			if err := p.writeVariableAnnotations(file, *variable); err != nil {
+				return err
 			}
 		}
 
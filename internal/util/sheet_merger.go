@@ -4,7 +4,8 @@ import (
 	"encoding/json"
 	"fmt"
 	"os"
-	"strings"
+
+	"github.com/n1rna/ee-cli/internal/parser"
 )
 
 // EnvResolver handles resolving environment definitions to key-value pairs
@@ -41,8 +42,14 @@ func (r *EnvResolver) MergeEnvironment(
 		return map[string]string{}, nil
 	}
 
-	// Merge sources in order (later sources override earlier ones)
-	result := make(map[string]string)
+	// Check every file source before parsing any, so a missing file fails fast
+	if err := checkFileReferences(refs); err != nil {
+		return nil, err
+	}
+
+	// Merge sources in order (later sources override earlier ones). Every
+	// resolved map is freshly built, so the first one becomes the result.
+	var result map[string]string
 	for i, ref := range refs {
 		values, err := r.resolveReference(ref)
 		if err != nil {
@@ -52,6 +59,10 @@ func (r *EnvResolver) MergeEnvironment(
 			)
 		}
 
+		if result == nil {
+			result = values
+			continue
+		}
 		for key, value := range values {
 			result[key] = value
 		}
@@ -60,13 +71,30 @@ func (r *EnvResolver) MergeEnvironment(
 	return result, nil
 }
 
+// checkFileReferences verifies that every .env file reference in refs exists
+func checkFileReferences(refs []interface{}) error {
+	for i, ref := range refs {
+		path, ok := ref.(string)
+		if !ok {
+			continue
+		}
+		if _, err := os.Stat(path); os.IsNotExist(err) {
+			return fmt.Errorf(
+				"failed to resolve source reference %d: .env file not found: %s",
+				i, path,
+			)
+		}
+	}
+	return nil
+}
+
 // resolveReference resolves a single source reference to its key-value pairs
 func (r *EnvResolver) resolveReference(
 	ref interface{},
 ) (map[string]string, error) {
 	switch v := ref.(type) {
 	case string:
-		return r.resolveDotEnvFile(v)
+		return r.parseDotEnvFile(v)
 	case map[string]interface{}:
 		return r.resolveInlineObject(v)
 	default:
@@ -74,17 +102,6 @@ func (r *EnvResolver) resolveReference(
 	}
 }
 
-// resolveDotEnvFile resolves a .env file reference
-func (r *EnvResolver) resolveDotEnvFile(
-	path string,
-) (map[string]string, error) {
-	if _, err := os.Stat(path); os.IsNotExist(err) {
-		return nil, fmt.Errorf(".env file not found: %s", path)
-	}
-
-	return r.parseDotEnvFile(path)
-}
-
 // resolveInlineObject resolves an inline object (direct key-value pairs)
 func (r *EnvResolver) resolveInlineObject(
 	obj map[string]interface{},
@@ -119,50 +136,12 @@ func (r *EnvResolver) parseDotEnvFile(
 		return nil, fmt.Errorf("failed to read .env file: %w", err)
 	}
 
-	result := make(map[string]string)
-	lines := strings.Split(string(content), "\n")
-
-	for lineNum, line := range lines {
-		line = strings.TrimSpace(line)
-
-		// Skip empty lines and comments
-		if line == "" || strings.HasPrefix(line, "#") {
-			continue
-		}
-
-		// Parse KEY=VALUE format
-		parts := strings.SplitN(line, "=", 2)
-		if len(parts) != 2 {
-			return nil, fmt.Errorf(
-				"invalid line %d in .env file %s: %s",
-				lineNum+1, path, line,
-			)
-		}
-
-		key := strings.TrimSpace(parts[0])
-		value := strings.TrimSpace(parts[1])
-
-		// Remove surrounding quotes if present
-		if len(value) >= 2 {
-			if (strings.HasPrefix(value, "\"") &&
-				strings.HasSuffix(value, "\"")) ||
-				(strings.HasPrefix(value, "'") &&
-					strings.HasSuffix(value, "'")) {
-				value = value[1 : len(value)-1]
-			}
-		}
-
-		if key == "" {
-			return nil, fmt.Errorf(
-				"empty variable name on line %d in .env file %s",
-				lineNum+1, path,
-			)
-		}
-
-		result[key] = value
+	values, err := parser.ParseDotEnv(content)
+	if err != nil {
+		return nil, fmt.Errorf("invalid .env file %s: %w", path, err)
 	}
 
-	return result, nil
+	return values, nil
 }
 
 // EnvironmentSources defines the sources for resolving environment values.
@@ -0,0 +1,53 @@
+package util
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+)
+
+func TestMergeEnvironmentFailsOnMissingSource(t *testing.T) {
+	dir := t.TempDir()
+	existing := filepath.Join(dir, ".env.base")
+	if err := os.WriteFile(existing, []byte("PORT=3000\n"), 0o644); err != nil {
+		t.Fatalf("failed to write .env file: %v", err)
+	}
+	missing := filepath.Join(dir, ".env.missing")
+	refs := []interface{}{existing, missing}
+
+	err := checkFileReferences(refs)
+	if err == nil || !strings.Contains(err.Error(), missing) {
+		t.Errorf("checkFileReferences: expected an error naming %s, got %v", missing, err)
+	}
+
+	values, err := NewEnvResolver().MergeEnvironment(EnvironmentSources{Sources: refs})
+	if err == nil || !strings.Contains(err.Error(), missing) {
+		t.Errorf("MergeEnvironment: expected an error naming %s, got %v", missing, err)
+	}
+	if values != nil {
+		t.Errorf("expected no partially merged values, got %v", values)
+	}
+
+	// The check runs before any source is parsed, so an invalid earlier file
+	// does not mask the missing one
+	if err := os.WriteFile(existing, []byte("not a variable\n"), 0o644); err != nil {
+		t.Fatalf("failed to write .env file: %v", err)
+	}
+	if _, err := NewEnvResolver().MergeEnvironment(EnvironmentSources{Sources: refs}); err == nil ||
+		!strings.Contains(err.Error(), "not found: "+missing) {
+		t.Errorf("expected the missing file to be reported first, got %v", err)
+	}
+}
+
+func TestCheckFileReferencesSkipsInlineSources(t *testing.T) {
+	existing := filepath.Join(t.TempDir(), ".env")
+	if err := os.WriteFile(existing, []byte("PORT=3000\n"), 0o644); err != nil {
+		t.Fatalf("failed to write .env file: %v", err)
+	}
+
+	refs := []interface{}{existing, map[string]interface{}{"DEBUG": "true"}}
+	if err := checkFileReferences(refs); err != nil {
+		t.Errorf("unexpected error: %v", err)
+	}
+}
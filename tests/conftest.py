@@ -1,58 +1,274 @@
 """
 pytest configuration and fixtures for ee-cli integration tests
+
+Storage fixtures come in two scopes. The function-scoped ones (`temp_home`,
+`ee_runner`) give every test its own isolated EE_HOME and must be used by any
+test that changes ee state. The session-scoped ones (`generic_schema`,
+`fixtures_tmpfs`) are created once per test session and shared by every test
+that requests them, so they are read-only by contract: tests may read the
+generic schema and fixture files but must never modify them.
 """
+import json
 import os
+import socket
+import struct
 import subprocess
 import tempfile
+import time
 import shutil
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
 import pytest
 
+from json_helpers import parse_json
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Inputs that affect the ee binary; embedded assets live under internal/
+SOURCE_DIRS = ("cmd", "internal", "pkg")
+SOURCE_FILES = ("go.mod", "go.sum")
+
+# Unix socket paths are limited to 104-108 bytes depending on the platform
+MAX_SOCKET_PATH = 100
+DAEMON_START_TIMEOUT = 5.0
+
+# RAM-backed filesystem used as pytest's temp root when available
+TMPFS_DIR = Path("/dev/shm")
+
+
+def _tmpfs_root():
+    """Return a writable tmpfs directory, or None if unavailable or disabled"""
+    if os.environ.get("EE_TMPFS") == "0":
+        return None
+    if TMPFS_DIR.is_dir() and os.access(TMPFS_DIR, os.W_OK):
+        return TMPFS_DIR
+    return None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Put pytest's temp root on tmpfs so fixture file I/O stays in memory"""
+    # An explicit --basetemp always wins. This also covers pytest-xdist
+    # workers, which are handed their own subdirectory of the controller's
+    # basetemp (e.g. /dev/shm/pytest-of-<user>/pytest-3/popen-gw0).
+    if config.option.basetemp:
+        return
+
+    # Only the root moves: pytest still creates a numbered basetemp per run
+    # under it, so concurrent runs never clean up each other's directories
+    # and tmp_path_retention_count keeps applying
+    tmpfs = _tmpfs_root()
+    if tmpfs is not None:
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(tmpfs))
+
+
+def _binary_is_fresh(project_root, binary_path):
+    """Return True if binary_path exists and is newer than every build input"""
+    if not binary_path.exists():
+        return False
+
+    inputs = [project_root / name for name in SOURCE_FILES]
+    for dirname in SOURCE_DIRS:
+        inputs.extend(p for p in (project_root / dirname).rglob("*") if p.is_file())
+
+    newest_source = max(p.stat().st_mtime for p in inputs if p.exists())
+    return binary_path.stat().st_mtime > newest_source
+
+
+def _go_build_env():
+    """
+    Environment for `go build`. The regular Go build cache is used, so the
+    build reuses packages already compiled by `make test` (and restored by CI).
+    Setting EE_TEST_GOCACHE_TMPFS=1 moves the build cache to tmpfs instead,
+    unless GOCACHE is set explicitly.
+    """
+    env = os.environ.copy()
+    if os.environ.get("EE_TEST_GOCACHE_TMPFS") != "1" or "GOCACHE" in env:
+        return env
+
+    tmpfs = _tmpfs_root()
+    if tmpfs is not None:
+        env["GOCACHE"] = str(tmpfs / f"ee-gocache-{os.getuid()}")
+    return env
+
+
+@contextmanager
+def _build_lock(lock_path):
+    """Hold an exclusive lock so concurrent pytest-xdist workers build ee one at a time"""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def _needs_build(project_root, binary_path, stamp_path):
+    """Return True if the ee binary has to be (re)built for this test run"""
+    if os.environ.get("EE_FORCE_REBUILD") == "1":
+        # Under xdist every worker sees the same run id, so a forced build
+        # only has to happen once per run rather than once per worker
+        run_id = os.environ.get("PYTEST_XDIST_TESTRUNUID")
+        return run_id is None or not stamp_path.exists() or stamp_path.read_text() != run_id
+
+    return not _binary_is_fresh(project_root, binary_path)
+
 
 @pytest.fixture(scope="session")
 def ee_binary():
-    """Build and return path to ee binary"""
+    """Build and return path to ee binary, skipping the build when up to date"""
     project_root = Path(__file__).parent.parent
-    binary_path = project_root / "build" / "ee"
-
-    # Build the binary
-    print(f"\nBuilding ee binary at {binary_path}...")
-    result = subprocess.run(
-        ["go", "build", "-o", str(binary_path), "./cmd/ee"],
-        cwd=project_root,
-        capture_output=True,
-        text=True
-    )
+    build_dir = project_root / "build"
+    # `ee --serve` is only compiled in with the eeserve build tag, so daemon
+    # runs build a separate binary rather than reusing the regular one
+    daemon = os.environ.get("EE_TEST_DAEMON") == "1"
+    binary_name = "ee-serve" if daemon else "ee"
+    binary_path = build_dir / binary_name
+    stamp_path = build_dir / f"{binary_name}.run-id"
+    build_tags = ["-tags", "eeserve"] if daemon else []
 
-    if result.returncode != 0:
-        pytest.fail(f"Failed to build ee binary:\n{result.stderr}")
+    with _build_lock(build_dir / "ee.lock"):
+        if _needs_build(project_root, binary_path, stamp_path):
+            # Build the binary
+            print(f"\nBuilding ee binary at {binary_path}...")
+            # Debug info and VCS stamping are not needed for the tests and
+            # only add link time and a git invocation to every build. These
+            # flags only affect linking, so compiled packages are shared with
+            # `make build` and `make test` through the build cache.
+            result = subprocess.run(
+                [
+                    "go", "build", "-buildvcs=false", "-ldflags=-s -w", *build_tags,
+                    "-o", str(binary_path), "./cmd/ee"
+                ],
+                cwd=project_root,
+                env=_go_build_env(),
+                capture_output=True,
+                text=True
+            )
 
-    if not binary_path.exists():
-        pytest.fail(f"Binary not found at {binary_path}")
+            if result.returncode != 0:
+                pytest.fail(f"Failed to build ee binary:\n{result.stderr}")
+
+            if not binary_path.exists():
+                pytest.fail(f"Binary not found at {binary_path}")
+
+            run_id = os.environ.get("PYTEST_XDIST_TESTRUNUID")
+            if run_id is not None:
+                stamp_path.write_text(run_id)
+
+            print(f"Successfully built ee binary at {binary_path}")
+        else:
+            print(f"\nUsing up-to-date ee binary at {binary_path}")
 
-    print(f"Successfully built ee binary at {binary_path}")
     yield str(binary_path)
 
 
-@pytest.fixture
-def temp_home(tmp_path):
-    """Create a temporary home directory for ee storage"""
-    ee_home = tmp_path / ".ee"
-    ee_home.mkdir()
-    return str(ee_home)
+@pytest.fixture(scope="session")
+def ee_daemon(ee_binary, tmp_path_factory):
+    """
+    Start a long-running `ee --serve` process when EE_TEST_DAEMON=1.
 
+    Yields the path of its Unix socket, or None when the daemon is disabled or
+    fails to start, in which case commands run as one subprocess each.
+    """
+    if os.environ.get("EE_TEST_DAEMON") != "1":
+        yield None
+        return
 
-@pytest.fixture
-def temp_project_dir(tmp_path):
-    """Create a temporary project directory"""
-    project_dir = tmp_path / "test-project"
-    project_dir.mkdir()
-    return str(project_dir)
+    sock_path = tmp_path_factory.mktemp("ee-daemon") / "ee.sock"
+    if len(str(sock_path)) > MAX_SOCKET_PATH:
+        yield None
+        return
 
+    process = subprocess.Popen(
+        [ee_binary, "--serve", str(sock_path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
 
-@pytest.fixture
-def ee_runner(ee_binary, temp_home):
-    """Return a function to run ee commands with isolated storage"""
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while not sock_path.exists() and process.poll() is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    if not sock_path.exists():
+        process.kill()
+        process.wait()
+        yield None
+        return
+
+    yield str(sock_path)
+
+    process.terminate()
+    process.wait()
+
+
+def _recv_exact(sock, size):
+    """Read exactly size bytes from sock"""
+    chunks = []
+    while size > 0:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("ee daemon closed the connection")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _call_daemon(sock_path, request):
+    """Send one length-prefixed JSON request to the ee daemon and return its response"""
+    payload = json.dumps(request).encode()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(sock_path)
+        sock.sendall(struct.pack(">I", len(payload)) + payload)
+        (size,) = struct.unpack(">I", _recv_exact(sock, 4))
+        return parse_json(_recv_exact(sock, size))
+
+
+class EEResult:
+    """
+    Result of an ee invocation, exposing the same attributes as
+    subprocess.CompletedProcess. Output captured as bytes is only decoded
+    when a test actually reads stdout or stderr.
+    """
+
+    def __init__(self, args, returncode, stdout, stderr):
+        self.args = args
+        self.returncode = returncode
+        self._stdout = stdout
+        self._stderr = stderr
+
+    @staticmethod
+    def _decode(output):
+        return output.decode() if isinstance(output, bytes) else output
+
+    @cached_property
+    def stdout(self):
+        return self._decode(self._stdout)
+
+    @cached_property
+    def stderr(self):
+        return self._decode(self._stderr)
+
+    def json(self):
+        """Parse stdout as JSON, straight from the captured bytes"""
+        return parse_json(self._stdout)
+
+    def __repr__(self):
+        return f"EEResult(args={self.args!r}, returncode={self.returncode!r})"
+
+
+def _make_runner(ee_binary, ee_home, daemon=None):
+    """
+    Return a function that runs ee commands with EE_HOME bound to ee_home,
+    through the ee daemon socket when one is given
+    """
     def run(args, input_text=None, cwd=None, check=True):
         """
         Run ee command with given arguments
@@ -64,22 +280,31 @@ def ee_runner(ee_binary, temp_home):
             check: Whether to raise exception on non-zero exit code
 
         Returns:
-            subprocess.CompletedProcess object
+            EEResult object
         """
-        env = os.environ.copy()
-        env['EE_HOME'] = temp_home
-
         cmd = [ee_binary] + args
 
-        result = subprocess.run(
-            cmd,
-            input=input_text,
-            capture_output=True,
-            text=True,
-            env=env,
-            cwd=cwd,
-            check=False
-        )
+        if daemon is not None:
+            response = _call_daemon(daemon, {
+                "argv": args,
+                "cwd": str(cwd or os.getcwd()),
+                "stdin": input_text or "",
+                "env": {"EE_HOME": ee_home},
+            })
+            result = EEResult(cmd, response["rc"], response["stdout"], response["stderr"])
+        else:
+            env = os.environ.copy()
+            env['EE_HOME'] = ee_home
+
+            completed = subprocess.run(
+                cmd,
+                input=input_text.encode() if input_text is not None else None,
+                capture_output=True,
+                env=env,
+                cwd=cwd,
+                check=False
+            )
+            result = EEResult(cmd, completed.returncode, completed.stdout, completed.stderr)
 
         if check and result.returncode != 0:
             raise AssertionError(
@@ -95,9 +320,114 @@ def ee_runner(ee_binary, temp_home):
 
 
 @pytest.fixture
-def fixtures_dir():
+def temp_home(tmp_path):
+    """Create a temporary home directory for ee storage"""
+    ee_home = tmp_path / ".ee"
+    ee_home.mkdir()
+    return str(ee_home)
+
+
+@pytest.fixture
+def temp_project_dir(tmp_path):
+    """Create a temporary project directory"""
+    project_dir = tmp_path / "test-project"
+    project_dir.mkdir()
+    return str(project_dir)
+
+
+def _daemon_for(request, ee_daemon):
+    """Return ee_daemon unless the test is marked to run ee as a real process"""
+    if request.node.get_closest_marker("subprocess") is not None:
+        return None
+    return ee_daemon
+
+
+@pytest.fixture
+def ee_runner(ee_binary, temp_home, ee_daemon, request):
+    """Return a function to run ee commands with isolated storage"""
+    return _make_runner(ee_binary, temp_home, _daemon_for(request, ee_daemon))
+
+
+@pytest.fixture(scope="session")
+def generic_schema(tmp_path_factory):
+    """
+    Copy the generic web-service schema (fixtures/schema-web-service.yaml) once
+    per session and return its absolute path, suitable for `ee init --schema`.
+    Read-only: tests must not modify the file.
+    """
+    schema_path = tmp_path_factory.mktemp("schemas") / "generic-schema.yaml"
+    shutil.copy(FIXTURES_DIR / "schema-web-service.yaml", schema_path)
+    return schema_path
+
+
+@pytest.fixture(scope="session")
+def fixtures_tmpfs(tmp_path_factory):
+    """
+    Copy the fixture files to tmpfs once per session and return the copy's
+    directory, so ee reads fixtures from memory. Falls back to the checked-in
+    fixtures when tmpfs is unavailable. Read-only: tests must not modify it.
+    """
+    if _tmpfs_root() is None:
+        return FIXTURES_DIR
+
+    fixtures_copy = tmp_path_factory.mktemp("fixtures")
+    shutil.copytree(FIXTURES_DIR, fixtures_copy, dirs_exist_ok=True)
+    return fixtures_copy
+
+
+@pytest.fixture
+def fixtures_dir(fixtures_tmpfs):
     """Return path to test fixtures directory"""
-    return Path(__file__).parent / "fixtures"
+    return fixtures_tmpfs
+
+
+@pytest.fixture
+def create_env_files(temp_project_dir):
+    """Helper to write several .env files into the project directory at once"""
+    def _create(files, directory=None):
+        """
+        Args:
+            files: Mapping of file name to a dict of variables
+            directory: Target directory (default: temp_project_dir)
+
+        Returns:
+            List of created file paths, in the order given
+        """
+        base = Path(directory or temp_project_dir)
+        paths = []
+        for filename, values in files.items():
+            path = base / filename
+            path.write_text("".join(f"{key}={value}\n" for key, value in values.items()))
+            paths.append(str(path))
+        return paths
+
+    return _create
+
+
+@pytest.fixture
+def write_ee_config(temp_project_dir):
+    """Helper to write a complete .ee project file without running `ee init`"""
+    def _write(project_name, environments, schema=None, directory=None):
+        """
+        Args:
+            project_name: Value of the "project" field
+            environments: Mapping of environment name to its definition
+            schema: Optional schema definition (inline variables or ref)
+            directory: Target directory (default: temp_project_dir)
+
+        Returns:
+            Path of the written .ee file
+        """
+        config = {
+            "project": project_name,
+            "schema": schema or {},
+            "environments": environments,
+        }
+        ee_file = Path(directory or temp_project_dir) / ".ee"
+        ee_file.write_text(json.dumps(config, separators=(",", ":")))
+        return ee_file
+
+    return _write
 
 
 @pytest.fixture
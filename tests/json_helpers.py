@@ -0,0 +1,26 @@
+"""
+JSON helpers for the integration tests
+
+orjson is part of the dev dependency group, so `uv run pytest` parses ee output
+and .ee files with it straight from bytes. The standard library is only used
+when the suite runs in an environment without orjson.
+"""
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def parse_json(data):
+    """Parse a JSON document given as str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path):
+    """Read and parse the JSON file at path"""
+    return parse_json(Path(path).read_bytes())
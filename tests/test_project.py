@@ -1,12 +1,13 @@
 """
 Integration tests for project initialization and management
 """
-import json
 import os
 from pathlib import Path
 import pytest
 import shutil
 
+from json_helpers import read_json
+
 
 class TestProjectInit:
     """Test project initialization"""
@@ -14,7 +15,7 @@ class TestProjectInit:
     def test_init_basic_project(self, ee_runner, temp_project_dir):
         """Test initializing a basic project"""
         result = ee_runner(
-            ["init", "test-project"],
+            ["init", "test-project", "--no-samples"],
             cwd=temp_project_dir
         )
 
@@ -27,8 +28,7 @@ class TestProjectInit:
         assert ee_file.exists()
 
         # Verify .ee file content
-        with open(ee_file) as f:
-            project_config = json.load(f)
+        project_config = read_json(ee_file)
 
         assert project_config["project"] == "test-project"
         assert "environments" in project_config
@@ -41,7 +41,8 @@ class TestProjectInit:
         # Copy schema file to project directory
         shutil.copy(schema_file, Path(temp_project_dir) / "schema.yaml")
 
-        # Initialize project with schema file reference
+        # Initialize project with schema file reference; the sample .env file
+        # is generated from the schema, so the relative reference is resolved
         result = ee_runner(
             ["init", "web-project", "--schema", "./schema.yaml"],
             cwd=temp_project_dir
@@ -51,20 +52,30 @@ class TestProjectInit:
 
         # Verify project config
         ee_file = Path(temp_project_dir) / ".ee"
-        with open(ee_file) as f:
-            project_config = json.load(f)
+        project_config = read_json(ee_file)
 
         assert project_config["project"] == "web-project"
         assert "schema" in project_config
         assert project_config["schema"]["ref"] == "./schema.yaml"
 
+        # Verify the sample .env file lists the variables of the referenced schema
+        sample = (Path(temp_project_dir) / ".env.development").read_text()
+        assert "# schema: ./schema.yaml" in sample
+        keys = {
+            line.split("=", 1)[0]
+            for line in sample.splitlines()
+            if line and not line.startswith("#")
+        }
+        assert keys == {"DATABASE_URL", "PORT", "DEBUG", "API_KEY"}
+
     def test_init_project_with_inline_schema(self, ee_runner, temp_project_dir):
         """Test initializing a project with inline schema variables"""
         result = ee_runner(
             [
                 "init", "inline-project",
                 "--var", "DATABASE_URL:string:Database URL:true",
-                "--var", "PORT:number:Server Port:false:8080"
+                "--var", "PORT:number:Server Port:false:8080",
+                "--no-samples"
             ],
             cwd=temp_project_dir
         )
@@ -73,13 +84,36 @@ class TestProjectInit:
 
         # Verify inline schema
         ee_file = Path(temp_project_dir) / ".ee"
-        with open(ee_file) as f:
-            project_config = json.load(f)
+        project_config = read_json(ee_file)
 
         assert "schema" in project_config
         assert "variables" in project_config["schema"]
         assert len(project_config["schema"]["variables"]) == 2
 
+    def test_init_project_with_var_file(self, ee_runner, temp_project_dir, create_fixture_file):
+        """Test initializing a project with inline schema variables read from a file"""
+        var_file = create_fixture_file("vars.txt", (
+            "# Schema variables\n"
+            "DATABASE_URL:string:Database URL:true\n"
+            "\n"
+            "PORT:number:Server Port:false:8080\n"
+        ))
+
+        result = ee_runner(
+            ["init", "var-file-project", "--var-file", var_file, "--no-samples"],
+            cwd=temp_project_dir
+        )
+
+        assert result.returncode == 0
+
+        ee_file = Path(temp_project_dir) / ".ee"
+        project_config = read_json(ee_file)
+
+        variables = project_config["schema"]["variables"]
+        assert set(variables) == {"DATABASE_URL", "PORT"}
+        assert variables["DATABASE_URL"]["required"] is True
+        assert variables["PORT"]["default"] == "8080"
+
     def test_init_creates_sample_env_files(self, ee_runner, temp_project_dir):
         """Test that init creates sample .env files for environments"""
         result = ee_runner(
@@ -94,25 +128,28 @@ class TestProjectInit:
         assert (project_path / ".env.development").exists() or \
                (project_path / "development.env").exists()
 
+    def test_init_no_samples_skips_env_files(self, ee_runner, temp_project_dir):
+        """Test that init --no-samples writes only the .ee file"""
+        result = ee_runner(
+            ["init", "bare-project", "--no-samples"],
+            cwd=temp_project_dir
+        )
+
+        assert result.returncode == 0
+        assert sorted(os.listdir(temp_project_dir)) == [".ee"]
+
 
 class TestProjectEnvironments:
     """Test project environment management"""
 
-    def test_project_environment_detection(self, ee_runner, temp_project_dir, fixtures_dir):
+    def test_project_environment_detection(self, ee_runner, temp_project_dir, write_ee_config):
         """Test that project environments are detected from .ee file"""
-        # Initialize project
-        ee_runner(["init", "env-test"], cwd=temp_project_dir)
-
-        # Modify .ee file to add custom environments
-        ee_file = Path(temp_project_dir) / ".ee"
-        with open(ee_file) as f:
-            config = json.load(f)
-
-        config["environments"]["staging"] = {"env": ".env.staging"}
-        config["environments"]["production"] = {"env": ".env.production"}
-
-        with open(ee_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Write a project with custom environments
+        write_ee_config("env-test", {
+            "development": {"env": ".env.development"},
+            "staging": {"env": ".env.staging"},
+            "production": {"env": ".env.production"},
+        })
 
         # Verify command recognizes project context
         result = ee_runner(["verify"], cwd=temp_project_dir, check=False)
@@ -124,15 +161,10 @@ class TestProjectEnvironments:
 class TestProjectVerify:
     """Test project verification"""
 
-    def test_verify_valid_project(self, ee_runner, temp_project_dir, fixtures_dir):
+    def test_verify_valid_project(self, ee_runner, temp_project_dir, generic_schema):
         """Test verifying a valid project configuration with schema file"""
-        schema_file = fixtures_dir / "schema-web-service.yaml"
-
-        # Copy schema file to project directory
-        shutil.copy(schema_file, Path(temp_project_dir) / "schema.yaml")
-
-        # Initialize project with schema file reference
-        ee_runner(["init", "verify-project", "--schema", "./schema.yaml"], cwd=temp_project_dir)
+        # Initialize project with a reference to the shared schema file
+        ee_runner(["init", "verify-project", "--schema", str(generic_schema)], cwd=temp_project_dir)
 
         # Create .env file for development environment with required variables
         dev_env = Path(temp_project_dir) / ".env.development"
@@ -148,20 +180,13 @@ class TestProjectVerify:
         # Project should be verifiable
         assert result.returncode == 0 or "project" in result.stdout.lower()
 
-    def test_verify_project_with_missing_env_files(self, ee_runner, temp_project_dir):
+    def test_verify_project_with_missing_env_files(self, ee_runner, temp_project_dir,
+                                                   write_ee_config):
         """Test verifying a project with missing .env files"""
-        # Initialize project
-        ee_runner(["init", "missing-env-project"], cwd=temp_project_dir)
-
-        # Update .ee to reference non-existent .env file
-        ee_file = Path(temp_project_dir) / ".ee"
-        with open(ee_file) as f:
-            config = json.load(f)
-
-        config["environments"]["test"] = {"env": ".env.nonexistent"}
-
-        with open(ee_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Reference a non-existent .env file
+        write_ee_config("missing-env-project", {
+            "test": {"env": ".env.nonexistent"}
+        })
 
         # Verify should report issues
         result = ee_runner(["verify"], cwd=temp_project_dir, check=False)
@@ -174,24 +199,16 @@ class TestProjectVerify:
 class TestProjectApply:
     """Test applying project environments"""
 
-    def test_apply_project_environment(self, ee_runner, temp_project_dir, fixtures_dir):
+    def test_apply_project_environment(self, ee_runner, temp_project_dir, write_ee_config):
         """Test applying a project environment"""
-        # Initialize project
-        ee_runner(["init", "apply-project"], cwd=temp_project_dir)
-
         # Create .env file for development
         dev_env = Path(temp_project_dir) / ".env.development"
         dev_env.write_text("DATABASE_URL=postgres://localhost/dev\nPORT=3000\n")
 
-        # Update .ee to use our .env file
-        ee_file = Path(temp_project_dir) / ".ee"
-        with open(ee_file) as f:
-            config = json.load(f)
-
-        config["environments"]["development"]["env"] = ".env.development"
-
-        with open(ee_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Write a project that uses our .env file
+        write_ee_config("apply-project", {
+            "development": {"env": ".env.development"}
+        })
 
         # Apply environment with dry-run to see what would be applied
         result = ee_runner(
@@ -202,7 +219,7 @@ class TestProjectApply:
         assert result.returncode == 0
 
         # Parse output
-        env_vars = json.loads(result.stdout)
+        env_vars = result.json()
         assert "DATABASE_URL" in env_vars
         assert env_vars["PORT"] == "3000"
 
@@ -218,10 +235,65 @@ class TestProjectApply:
 
         assert result.returncode == 0
 
-        env_vars = json.loads(result.stdout)
+        env_vars = result.json()
         assert "DATABASE_URL" in env_vars
         assert env_vars["PORT"] == "8000"
 
+    def test_apply_env_from_stdin(self, ee_runner, temp_project_dir, fixtures_dir):
+        """Test applying .env content piped on standard input"""
+        env_content = (fixtures_dir / "config-base.env").read_text()
+
+        result = ee_runner(
+            ["apply", "-", "--dry-run", "--format", "json"],
+            input_text=env_content,
+            cwd=temp_project_dir
+        )
+
+        assert result.returncode == 0
+
+        env_vars = result.json()
+        assert "DATABASE_URL" in env_vars
+        assert env_vars["PORT"] == "8000"
+
+    def test_apply_stdin_without_command_fails(self, ee_runner, temp_project_dir):
+        """Test that apply - refuses to start a shell, since stdin is already consumed"""
+        result = ee_runner(
+            ["apply", "-"],
+            input_text="PORT=8000\n",
+            cwd=temp_project_dir,
+            check=False
+        )
+
+        assert result.returncode != 0
+        assert "--dry-run" in result.stderr
+
+    @pytest.mark.subprocess
+    def test_apply_runs_command_with_environment(self, ee_runner, temp_project_dir,
+                                                 fixtures_dir):
+        """Test that apply runs a command with the variables in its environment"""
+        env_file = fixtures_dir / "config-base.env"
+
+        result = ee_runner(
+            ["apply", str(env_file), "--", "sh", "-c", 'echo "PORT=$PORT"'],
+            cwd=temp_project_dir
+        )
+
+        assert result.returncode == 0
+        assert "PORT=8000" in result.stdout
+
+    @pytest.mark.subprocess
+    def test_apply_propagates_command_failure(self, ee_runner, temp_project_dir, fixtures_dir):
+        """Test that apply fails when the command it runs fails"""
+        env_file = fixtures_dir / "config-base.env"
+
+        result = ee_runner(
+            ["apply", str(env_file), "--", "sh", "-c", "exit 3"],
+            cwd=temp_project_dir,
+            check=False
+        )
+
+        assert result.returncode != 0
+
 
 class TestProjectWithoutContext:
     """Test commands that require project context"""